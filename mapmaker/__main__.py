@@ -57,6 +57,8 @@ def arg_parser():
                         help="Don't check if functional connectivity neurons are known in SCKAN. Sets `--invalid-neurons` option")
     generation_options.add_argument('--invalid-neurons', dest='invalidNeurons', action='store_true',
                         help="Include functional connectivity neurons that aren't known in SCKAN")
+    generation_options.add_argument('--jobs', metavar='N', type=int,
+                        help='Number of processes used to make background tiles (defaults to the number of CPUs)')
     generation_options.add_argument('--no-path-layout', dest='noPathLayout', action='store_true',
                         help="Don't do `TransitMap` optimisation of paths")
     generation_options.add_argument('--path-arrows', dest='pathArrows', action='store_true',
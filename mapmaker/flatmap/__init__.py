@@ -239,10 +239,10 @@ class FlatMap(object):
     #=========================================
         return os.path.join(self.__map_dir, localname)
 
-    def save_feature_for_node_lookup(self, feature: Feature):
-    #========================================================
+    def save_features_for_node_lookup(self, features: list[Feature]):
+    #================================================================
         if self.__feature_node_map is not None:
-            self.__feature_node_map.add_feature(feature)
+            self.__feature_node_map.add_features(features)
 
     def features_for_anatomical_node(self, anatomical_node: AnatomicalNode, warn: bool=True) -> Optional[tuple[AnatomicalNode, set[Feature]]]:
     #=========================================================================================================================================
@@ -280,11 +280,11 @@ class FlatMap(object):
     #=========================================================================
         return self.__features_by_geojson_id.get(geojson_id)
 
-    def new_feature(self, layer_id: str, geometry, properties, is_group=False) -> Feature:
-    #=====================================================================================
+    def new_feature(self, layer_id: str, geometry, properties, is_group=False, owned=False) -> Feature:
+    #=================================================================================================
         self.__last_geojson_id += 1
         self.properties_store.update_properties(properties)   # Update from JSON properties file
-        feature = Feature(self.__last_geojson_id, geometry, properties, is_group=is_group)
+        feature = Feature(self.__last_geojson_id, geometry, properties, is_group=is_group, owned=owned)
         feature.set_property('layer', layer_id)
         if (name := properties.get('name', properties.get('label', ''))) != '':
             self.__features_with_name[f'{layer_id}/{name.replace(" ", "_")}'] = feature
@@ -23,7 +23,10 @@ import json
 import typing
 from typing import Any, Optional, TYPE_CHECKING
 
+import numpy as np
+import shapely
 from shapely.geometry.base import BaseGeometry
+import shapely.strtree
 import structlog
 
 #===============================================================================
@@ -44,14 +47,19 @@ EXCLUDE_PROPERTIES_FROM_STR = [
 ]
 
 class Feature(PropertyMixin):
+    # Maps have many features so we use slots to reduce their size
+    __slots__ = ('__anatomical_nodes', '__centroid', '__geojson_id', '__geometry', '__is_group', '__layer')
+
     def __init__(self, geojson_id: int,
                        geometry: BaseGeometry,
                        properties: dict[str, Any],
-                       is_group:bool=False):
-        super().__init__(properties)
+                       is_group:bool=False,
+                       owned: bool=False):
+        super().__init__(properties, owned=owned)
         self.__anatomical_nodes: set[str] = set()
         self.__geojson_id = geojson_id     # Must be numeric for tipeecanoe
         self.__geometry = geometry
+        self.__centroid = None
         self.properties['featureId'] = geojson_id   # Used by flatmap viewer
         self.properties['geometry'] = geometry.geom_type
         self.__is_group = is_group
@@ -77,6 +85,12 @@ class Feature(PropertyMixin):
     def bounds(self) -> MapBounds:
         return self.__geometry.bounds
 
+    @property
+    def centroid(self) -> BaseGeometry:
+        if self.__centroid is None:
+            self.__centroid = self.__geometry.centroid
+        return self.__centroid
+
     @property
     def geojson_id(self) -> int:
         return self.__geojson_id
@@ -92,6 +106,7 @@ class Feature(PropertyMixin):
     @geometry.setter
     def geometry(self, geometry: BaseGeometry):
         self.__geometry = geometry
+        self.__centroid = None
 
     @property
     def id(self) -> Optional[str]:
@@ -134,11 +149,33 @@ class FeatureAnatomicalNodeMap:
                     else:
                         self.__anatomical_aliases[alias] = term
         self.__model_to_features: dict[str|tuple, set[Feature]] = defaultdict(set)
+        self.__layer_indexes: dict[str|tuple, Optional[BaseGeometry|shapely.strtree.STRtree]] = {}
 
-    def add_feature(self, feature: Feature):
-    #=======================================
-        if feature.models is not None:
-            self.__model_to_features[feature.models].add(feature)
+    def add_features(self, features: list[Feature]):
+    #===============================================
+        features_by_model: dict[str|tuple, list[Feature]] = defaultdict(list)
+        for feature in features:
+            if feature.models is not None:
+                features_by_model[feature.models].append(feature)
+        for model, model_features in features_by_model.items():
+            self.__model_to_features[model].update(model_features)
+            self.__layer_indexes.pop(model, None)
+
+    def __layer_index(self, term: str|tuple) -> Optional[BaseGeometry|shapely.strtree.STRtree]:
+    #==========================================================================================
+        # Built when first needed, a layer with a single feature is indexed by the
+        # feature's prepared geometry, otherwise by a spatial index of its features
+        term = self.__anatomical_aliases.get(term, term)
+        if term not in self.__layer_indexes:
+            geometries = [feature.geometry for feature in self.__model_to_features.get(term, [])]
+            if len(geometries) == 0:
+                self.__layer_indexes[term] = None
+            elif len(geometries) == 1:
+                shapely.prepare(geometries[0])
+                self.__layer_indexes[term] = geometries[0]
+            else:
+                self.__layer_indexes[term] = shapely.strtree.STRtree(geometries)
+        return self.__layer_indexes[term]
 
     def features_for_anatomical_node(self, anatomical_node: AnatomicalNode, warn: bool=False) -> tuple[AnatomicalNode, set[Feature]]:
     #================================================================================================================================
@@ -187,20 +224,19 @@ class FeatureAnatomicalNodeMap:
             return (matched_node, features)
 
         # Restrict found features to those contained in specified layers
+        features_list = list(features)
+        centroids = [feature.centroid for feature in features_list]
+        (centroid_x, centroid_y) = (shapely.get_x(centroids), shapely.get_y(centroids))
         matched_features = set()
-        for feature in features:
-            feature_in_layers = False
-            for anatomical_layer in anatomical_layers:
-                feature_in_layer = False
-                for layer_feature in features_from_anatomical_id(anatomical_layer):
-                    if layer_feature.geometry.contains(feature.geometry.centroid):
-                        feature_in_layer = True
-                        break
-                if feature_in_layer:
-                    feature_in_layers = True
-                    break
-            if feature_in_layers:
-                matched_features.add(feature)
+        for anatomical_layer in anatomical_layers:
+            # Find indices of centroids that are within some feature of the layer
+            if (layer_index := self.__layer_index(anatomical_layer)) is None:
+                continue
+            elif isinstance(layer_index, shapely.strtree.STRtree):
+                (centroid_indices, _) = layer_index.query(centroids, predicate='within')
+            else:
+                centroid_indices = np.flatnonzero(shapely.contains_xy(layer_index, centroid_x, centroid_y))
+            matched_features.update(features_list[n] for n in centroid_indices)
         if len(matched_features) == 0 and len(features) == 1:
             matched_features = features
             if warn:
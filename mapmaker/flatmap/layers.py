@@ -124,9 +124,9 @@ class FeatureLayer(object):
                     feature.set_property('exclude', True)
             if feature.get_property('type') == 'nerve' or feature.get_property('node', False):
                 feature.set_property('tile-layer', PATHWAYS_TILE_LAYER)
-            if self.__exported:
-                # Save relationship between id/class and internal feature id
-                self.__flatmap.save_feature_for_node_lookup(feature)
+        if self.__exported:
+            # Save relationship between id/class and internal feature id
+            self.__flatmap.save_features_for_node_lookup(self.__features)
 
 #===============================================================================
 
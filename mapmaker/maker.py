@@ -24,12 +24,13 @@ import pathlib
 import multiprocessing.connection
 import shutil
 import subprocess
+import threading
 import uuid
 
 #===============================================================================
 
 from . import FLATMAP_VERSION, __version__
-from .utils import configure_logging, log, set_as_list
+from .utils import compact_json, configure_logging, log
 
 #===============================================================================
 
@@ -77,6 +78,13 @@ INVALID_PUBLISHING_OPTIONS = [
 
 #===============================================================================
 
+def remove_files(filenames: list[str]):
+#======================================
+    for filename in filenames:
+        os.remove(filename)
+
+#===============================================================================
+
 class MapMaker(object):
     def __init__(self, options):
         # ``silent`` implies not ``verbose``
@@ -132,6 +140,8 @@ class MapMaker(object):
 
         if options.get('backgroundTiles', False) and (cpu_count := os.cpu_count()) is not None and cpu_count < 2:
             raise ValueError('Cannot make background tiles on a single CPU system')
+        if (jobs := options.get('jobs')) is not None and jobs < 1:
+            raise ValueError('Number of jobs must be at least 1')
 
         # Check we have been given a map source and get our manifest
         if 'source' in options:
@@ -161,6 +171,7 @@ class MapMaker(object):
 
         # This is set here in case we have to clean up early
         self.__geojson_files = []
+        self.__geojson_remover = None
 
         # Our source of knowledge, updated with information about maps we've made, held in a global place
         sckan_version = options.get('sckanVersion', self.__manifest.sckan_version)
@@ -307,7 +318,7 @@ class MapMaker(object):
          and 'svg-maker' in self.__processing_store):
             svg_maker = self.__processing_store['svg-maker']
             svg_file = pathlib.Path(svg_export_file).with_suffix('.svg')
-            with open(svg_file, 'w') as fp:
+            with open(svg_file, 'wb') as fp:
                 svg_maker.save(fp)
                 log.info('Saved SVG', svg=svg_file)
 
@@ -342,6 +353,9 @@ class MapMaker(object):
         settings['KNOWLEDGE_STORE'].close()
 
         # Remove any GeoJSON files (unless ``--save-geojson)
+        if self.__geojson_remover is not None:
+            self.__geojson_remover.join()
+            self.__geojson_remover = None
         for filename in self.__geojson_files:
             if settings.get('saveGeoJSON', False):
                 print(filename)
@@ -418,7 +432,8 @@ class MapMaker(object):
         for layer in self.__flatmap.layers:
             for raster_layer in layer.raster_layers:
                 tilemaker = RasterTileMaker(raster_layer, self.__map_dir,
-                                            settings.get('maxRasterZoom', layer.max_zoom))
+                                            settings.get('maxRasterZoom', layer.max_zoom),
+                                            max_processes=settings.get('jobs'))
                 tilemakers.append(tilemaker)
                 if settings.get('backgroundTiles', False):
                     tilemaker_process = tilemaker.make_tiles()
@@ -455,6 +470,9 @@ class MapMaker(object):
                         ]
         if not compressed:
             tippe_command.append('--no-tile-compression')
+        if not settings.get('saveGeoJSON', False):
+            # Features are written one per line so can be parsed using multiple threads
+            tippe_command.append('--read-parallel')
         if not settings.get('verbose', True):
             tippe_command.append('--quiet')
         tippe_command += list(["-L{}".format(json.dumps(input)) for input in self.__tippe_inputs])
@@ -467,12 +485,20 @@ class MapMaker(object):
         # map bounds, which is not the same as the extracted bounds, so update
         # the map's metadata
         tile_db = MBTiles(self.__mbtiles_file)
-        tile_db.add_metadata(compressed=compressed)
-        tile_db.add_metadata(center=','.join([str(x) for x in self.__flatmap.centre]),      # type: ignore
+        tile_db.add_metadata(compressed=compressed,
+                             center=','.join([str(x) for x in self.__flatmap.centre]),      # type: ignore
                              bounds=','.join([str(x) for x in self.__flatmap.extent]))      # type: ignore
         tile_db.execute("COMMIT")
         tile_db.close();
 
+        # We've finished with the GeoJSON files so remove them in the background
+        # while the rest of the map is made
+        if not settings.get('saveGeoJSON', False):
+            self.__geojson_remover = threading.Thread(target=remove_files,
+                                                      args=(self.__geojson_files,))
+            self.__geojson_remover.start()
+            self.__geojson_files = []
+
     def __output_features(self):
     #===========================
         log.info('Outputting features...')
@@ -522,16 +548,14 @@ class MapMaker(object):
         if (git_status := self.__manifest.git_status) is not None:
             metadata['git-status'] = git_status
             metadata['git-status']['committed'] = metadata['git-status']['committed'].isoformat(timespec='milliseconds')
-        tile_db.add_metadata(metadata=json.dumps(metadata))
-
-        # Save layer details in metadata
-        tile_db.add_metadata(layers=json.dumps(self.__flatmap.layer_metadata()))
-        # Save pathway details in metadata
-        tile_db.add_metadata(pathways=json.dumps(self.__flatmap.connectivity()))
-        # Save annotations in metadata
-        tile_db.add_metadata(annotations=json.dumps(self.__flatmap.annotations, default=set_as_list))
-        # Save node_hierarchy in metadata
-        tile_db.add_metadata(node_hierarchy=json.dumps(self.__flatmap.properties_store.node_hierarchy))
+        # Save it, along with layer details, pathway details, annotations and
+        # the node hierarchy, as a single batch
+        tile_db.add_metadata(
+            metadata=compact_json(metadata),
+            layers=compact_json(self.__flatmap.layer_metadata()),
+            pathways=compact_json(self.__flatmap.connectivity()),
+            annotations=compact_json(self.__flatmap.annotations),
+            node_hierarchy=compact_json(self.__flatmap.properties_store.node_hierarchy))
 
         # Commit updates to the database
         tile_db.execute("COMMIT")
@@ -571,13 +595,14 @@ class MapMaker(object):
 
         # Create `index.json` for building a map in the viewer
         with open(os.path.join(self.__map_dir, 'index.json'), 'w') as output_file:
-            json.dump(map_index, output_file)
+            output_file.write(compact_json(map_index))
 
-        # Create style file
-        metadata = tile_db.metadata()
+        # Create style file, only reading the metadata it needs and not
+        # the (large) annotation and pathway metadata we've just saved
+        metadata = tile_db.metadata(names=['bounds', 'center', 'json'])
         style_dict = MapStyle.style(self.__raster_layers, metadata, self.__zoom)
         with open(os.path.join(self.__map_dir, 'style.json'), 'w') as output_file:
-            json.dump(style_dict, output_file)
+            output_file.write(compact_json(style_dict))
 
         tile_db.close();
 
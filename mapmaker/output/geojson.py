@@ -32,7 +32,7 @@ import shapely.geometry
 from mapmaker.flatmap import FlatMap, MapLayer
 from mapmaker.geometry import mercator_transform
 from mapmaker.settings import MAP_KIND, settings
-from mapmaker.utils import log, ProgressBar, set_as_list
+from mapmaker.utils import compact_json, log, ProgressBar, set_as_list
 
 from . import ENCODED_FEATURE_PROPERTIES, EXPORTED_FEATURE_PROPERTIES
 
@@ -64,8 +64,8 @@ class GeoJSONOutput(object):
                 else:
                     # Tippecanoe doesn't need a FeatureCollection
                     # Delimit features with RS...LF   (RS = 0x1E)
-                    for feature in features:
-                        output_file.write('\x1E{}\x0A'.format(json.dumps(feature, default=set_as_list)))
+                    # and write them all at once
+                    output_file.write(''.join([f'\x1E{compact_json(feature)}\x0A' for feature in features]))
         return saved_filenames
 
     def __save_features(self, features):
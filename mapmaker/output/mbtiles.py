@@ -57,13 +57,15 @@ class MBTiles(object):
         return self._cursor.execute(sql)
 
     def add_metadata(self, **metadata):
-        for name, value in metadata.items():
-            self._cursor.execute('replace into metadata(name, value) values (?, ?);',
-                                                                            (name, value))
+        self._cursor.executemany('replace into metadata(name, value) values (?, ?);',
+                                                                    metadata.items())
 
-    def metadata(self, name=None):
+    def metadata(self, name=None, names=None):
         if name is not None:
             return self._cursor.execute('select value from metadata where name=?;', (name, )).fetchone()[0]
+        elif names is not None:
+            return dict(self._connnection.execute('select name, value from metadata where name in ({});'
+                                                    .format(', '.join(len(names)*['?'])), tuple(names)).fetchall())
         else:
             return dict(self._connnection.execute('select name, value from metadata;').fetchall())
 
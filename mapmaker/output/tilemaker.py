@@ -21,7 +21,7 @@
 import os
 import queue
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 #===============================================================================
 
@@ -412,10 +412,14 @@ class RasterTileMaker(object):
     :type output_dir: str
     :param max_zoom: The range of zoom levels to generate tiles.
     :type max_zoom: int
+    :param max_processes: The maximum number of tile extraction processes to run.
+                          Defaults to the number of CPUs.
+    :type max_processes: int
     """
-    def __init__(self, raster_layer: 'RasterLayer', output_dir: str, max_zoom: int):
+    def __init__(self, raster_layer: 'RasterLayer', output_dir: str, max_zoom: int, max_processes: Optional[int]=None):
         self.__raster_layer = raster_layer
         self.__max_zoom = max_zoom
+        self.__max_processes = MAX_TILE_PROCESSES if max_processes is None else max_processes
         self.__id = raster_layer.id
         self.__database_path = os.path.join(output_dir, f'{raster_layer.id}.mbtiles')
         self.__min_zoom = raster_layer.min_zoom
@@ -432,7 +436,7 @@ class RasterTileMaker(object):
 
         zoom = self.__max_zoom
         tile_count = len(self.__tile_set)
-        log.info(f'Tiling zoom level {zoom} for layer', zoom=zoom, layer=self.__id, tiles=tile_count, cpus=MAX_TILE_PROCESSES)
+        log.info(f'Tiling zoom level {zoom} for layer', zoom=zoom, layer=self.__id, tiles=tile_count, cpus=self.__max_processes)
 
         tile_processes = {}
         running = True
@@ -442,7 +446,7 @@ class RasterTileMaker(object):
         tile_pos = 0
         while running:
             # Start a tile extraction process if where have spare processors
-            while not ending and len(tile_processes) < MAX_TILE_PROCESSES:
+            while not ending and len(tile_processes) < self.__max_processes:
                 if tile_pos < tile_count:
                     tiles = self.__tile_set[tile_pos:tile_pos + TILE_BATCH_SIZE]
                     tile_process = self.__extract_tile__process(tiles, tile_extractor, image_queue)
@@ -451,11 +455,13 @@ class RasterTileMaker(object):
                 else:
                     ending = True
 
-            # Save extracted tile images
+            # Save all extracted tile images that are waiting, so that
+            # we keep up with the extraction processes
             try:
-                (x, y, image) = image_queue.get(block=False)
-                mbtiles.save_tile_as_png(zoom, x, y, image)
-                tiles_processed += 1
+                while True:
+                    (x, y, image) = image_queue.get(block=False)
+                    mbtiles.save_tile_as_png(zoom, x, y, image)
+                    tiles_processed += 1
             except queue.Empty:
                 pass
 
@@ -36,7 +36,8 @@ class AnatomicalMap(object):
         else:
             path = FilePath(anatomical_map)
             if path.extension in ['xls', 'xlsx']:
-                self.__map = self.__load_spreadsheet(path.get_BytesIO())
+                with path.get_local_fp() as fp:
+                    self.__map = self.__load_spreadsheet(fp)
             else:
                 self.__map = path.get_json()
         self.__missing_terms = []
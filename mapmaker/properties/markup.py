@@ -18,6 +18,10 @@
 #
 #===============================================================================
 
+import sys
+
+#===============================================================================
+
 from pyparsing import alphanums, nums, printables
 from pyparsing import Combine, delimitedList, Group, Keyword
 from pyparsing import Optional, Suppress, Word, ZeroOrMore
@@ -105,6 +109,12 @@ DEPRECATED_MARKUP = [
     'style'
 ]
 
+# Markup with values that are likely to be repeated
+INTERNED_MARKUP_VALUES = [
+    'children',
+    'class',
+]
+
 #===============================================================================
 
 def parse_layer_directive(s):
@@ -128,16 +138,20 @@ def parse_markup(markup):
     try:
         parsed = SHAPE_MARKUP.parseString(markup, parseAll=True)
         for prop in parsed[1:]:
-            if prop[0] in DEPRECATED_MARKUP:
-                deprecated.append(prop[0])
-            if (FEATURE_FLAGS.matches(prop[0])
-             or SHAPE_FLAGS.matches(prop[0])):
-                properties[prop[0]] = True
-            elif prop[0] == 'details':
-                properties[prop[0]] = prop[1]
+            # Property names, and classes, are shared by many shapes
+            key = sys.intern(prop[0])
+            if key in DEPRECATED_MARKUP:
+                deprecated.append(key)
+            if (FEATURE_FLAGS.matches(key)
+             or SHAPE_FLAGS.matches(key)):
+                properties[key] = True
+            elif key == 'details':
+                properties[key] = prop[1]
                 properties['maxzoom'] = int(prop[2]) - 1
+            elif key in INTERNED_MARKUP_VALUES:
+                properties[key] = sys.intern(prop[1])
             else:
-                properties[prop[0]] = prop[1]
+                properties[key] = prop[1]
     except ParseException:
         properties['error'] = 'Syntax error'
         if settings.get('debug', False):
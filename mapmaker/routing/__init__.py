@@ -972,14 +972,14 @@ class Network(object):
                                     tmp_edge_dicts[(n, s)] = edge_dicts[0]
                                     break
                             if feature.id not in closest_feature_dict:
-                                closest_feature_id = self.__closest_feature_id_to_point(feature.geometry.centroid, segment_graph.nodes)
+                                closest_feature_id = self.__closest_feature_id_to_point(feature.centroid, segment_graph.nodes)
                                 closest_feature_dict[feature.id] = closest_feature_id
                                 tmp_edge_dicts[(feature.id, closest_feature_id)] = edge_dict
                     elif neighbour_dict['type'] in ['segment', 'no-segment']: # should check this limitation
                         candidates= {}
                         for n, s in itertools.product(neighbour_dict['subgraph'].nodes, segment_graph.nodes):
                             if (nf:=self.__map_feature(n)) is not None and (sf:=self.__map_feature(s)) is not None:
-                                candidates[(n,s)] = nf.geometry.centroid.distance(sf.geometry.centroid)
+                                candidates[(n,s)] = nf.centroid.distance(sf.centroid)
                             tmp_edge_dicts[(n,s)] = edge_dict
                         if len(candidates) > 0:
                             selected_c = min(candidates, key=candidates.get)    # type: ignore
@@ -1063,7 +1063,7 @@ class Network(object):
                     if se_dict.get('type') == 'segment' and \
                         len(se_dict.get('used', {})) > 0 and \
                         len(se_dict.get('used', {}) & set(properties['subgraph'].nodes)) == 0:
-                            candidates= {(n, s):self.__flatmap.get_feature(n).geometry.centroid.distance(self.__flatmap.get_feature(s).geometry.centroid)
+                            candidates= {(n, s):self.__flatmap.get_feature(n).centroid.distance(self.__flatmap.get_feature(s).centroid)
                                          for n, s in itertools.product(se_dict.get('used', set()), properties['subgraph'].nodes)}
                             if len(candidates) > 0:
                                 if len(selected:=min(candidates, key=candidates.get)) == 2:
@@ -1100,7 +1100,7 @@ class Network(object):
                                 candidates= {}
                                 for n, s in itertools.product(pn_used, n_used):
                                     if (nf:=self.__map_feature(n)) is not None and (sf:=self.__map_feature(s)) is not None:
-                                        candidates[(n,s)] = nf.geometry.centroid.distance(sf.geometry.centroid)
+                                        candidates[(n,s)] = nf.centroid.distance(sf.centroid)
                                     tmp_edge_dicts[(n,s)] = edge_dict
                                 if len(candidates) > 0:
                                     new_direct_edges.update([min(candidates, key=candidates.get)])  # type: ignore
@@ -1167,15 +1167,15 @@ class Network(object):
                         for f in features:
                             distances = []
                             for nf in neighbour_features:
-                                distances += [nf.geometry.centroid.distance(f.geometry.centroid)]
+                                distances += [nf.centroid.distance(f.centroid)]
                             feature_distances[f] = sum(distances)/len(distances)
                         selected_feature = min(feature_distances, key=feature_distances.get)    # type: ignore
                 else:
                     prev_features = [feature for features in used_features.values() for feature in features]
                     if len(prev_features) > 0 and len(features) > 1:
-                        min_distance = prev_features[-1].geometry.centroid.distance(features[0].geometry.centroid)
+                        min_distance = prev_features[-1].centroid.distance(features[0].centroid)
                         for f in (features:=[f for f in features[1:]]):
-                            if (distance:=prev_features[-1].geometry.centroid.distance(f.geometry.centroid)) < min_distance:
+                            if (distance:=prev_features[-1].centroid.distance(f.centroid)) < min_distance:
                                 min_distance = distance
                                 selected_feature = f
                     return get_ftu_node(selected_feature)
@@ -1196,7 +1196,7 @@ class Network(object):
         # sorting nodes with priority -> terminal, number of features (2 than 1, than any size), distance to neighbours
         one_feature_terminals = {
             n: min([
-                features[0].geometry.centroid.distance(nf.geometry.centroid)
+                features[0].centroid.distance(nf.centroid)
                 for nf in nfs
             ])
             for n, n_dict in connectivity_graph.nodes(data=True)
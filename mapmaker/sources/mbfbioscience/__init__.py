@@ -18,6 +18,7 @@
 #
 #===============================================================================
 
+import mmap
 from urllib.parse import urljoin
 
 #===============================================================================
@@ -76,8 +77,13 @@ class MBFSource(MapSource):
 
         filename = image_element.find(self.ns_tag('filename')).text
         image_file = FilePath(urljoin(self.href, filename.split('\\')[-1]))
-        image_array = np.frombuffer(image_file.get_data(), dtype=np.uint8)
-        self.__image = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
+        # Decode directly from a memory mapping of the image file, rather
+        # than first reading all of the encoded image into memory
+        with image_file.get_local_fp() as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+                image_array = np.frombuffer(image_data, dtype=np.uint8)
+                self.__image = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
+                del image_array     # Release our view of the mapping before it's closed
         if self.__image.shape[2] == 3:
             self.__image = cv2.cvtColor(self.__image, cv2.COLOR_RGB2RGBA)
         image_size = (self.__image.shape[1], self.__image.shape[0])
@@ -145,7 +151,7 @@ class MBFSource(MapSource):
                 properties['label'] = label
             if anatomical_id is not None:
                 properties['models'] = anatomical_id
-            feature = self.flatmap.new_feature(self.id, geometry, properties)
+            feature = self.flatmap.new_feature(self.id, geometry, properties, owned=True)
             feature.set_property('dataset', self.__sparc_dataset)
             feature.set_property('source', self.href)
             self.__layer.add_feature(feature)
@@ -18,8 +18,8 @@
 #
 #===============================================================================
 
-from io import BytesIO
 import pathlib
+from typing import Iterator
 
 #===============================================================================
 
@@ -76,27 +76,31 @@ class PowerpointLayer(MapLayer):
         self.add_group_features('Slide', features, outermost=True)
 
         if self.flatmap.map_kind == MAP_KIND.FUNCTIONAL:
+            # Lookups that don't change within the loop
+            authoring = settings.get('authoring', False)
+            get_feature = self.flatmap.get_feature
+            add_connection = self.flatmap.connection_set.add
             for feature in self.features:
                 if feature.get_property('cd-class') == CD_CLASS.CONNECTION:
                     # Map connection path class to viewer path kind/type
                     feature.set_property('tile-layer', PATHWAYS_TILE_LAYER)
                     for system_id in feature.get_property('system-ids', []):
-                        if (system_feature := self.flatmap.get_feature(system_id)) is not None:
+                        if (system_feature := get_feature(system_id)) is not None:
                             if (path_ids := system_feature.get_property('path-ids')) is not None:
                                 if feature.id not in path_ids:
                                     path_ids.append(feature.id)
                             else:
                                 system_feature.set_property('path-ids', [feature.id])
 
-                    if (settings.get('authoring', False)
+                    if (authoring
                     and (feature.has_property('error')
                       or feature.has_property('warning'))):
                         feature.set_property('kind', 'error')
                     node_ids = [node.geojson_id for node in
-                                    [self.flatmap.get_feature(node_id)
+                                    [get_feature(node_id)
                                         for node_id in feature.get_property('node-ids', [])]
                                     if node is not None]
-                    self.source.flatmap.connection_set.add(
+                    add_connection(
                         feature.id,                             # type:ignore (all FC features have an id)
                         feature.get_property('kind'),
                         feature.geojson_id,
@@ -110,13 +114,21 @@ class PowerpointLayer(MapLayer):
 
     def __process_shape_list(self, shapes: TreeList[Shape]) -> list[Feature]:
     #========================================================================
-        features: list[Feature] = []
-        for shape in shapes[1:]:
-            if isinstance(shape, TreeList):
-                group_features = self.__process_shape_list(shape)
-                grouped_feature = self.add_group_features('Group', group_features)
+        # Nested groups are traversed using a stack of (group features, remaining shapes)
+        # rather than by recursion. A group's feature is added after all of its shapes
+        # have been processed.
+        stack: list[tuple[list[Feature], Iterator[Shape|TreeList[Shape]]]] = [([], iter(shapes[1:]))]
+        while True:
+            (features, shape_iter) = stack[-1]
+            if (shape := next(shape_iter, None)) is None:
+                stack.pop()
+                if len(stack) == 0:
+                    return features
+                grouped_feature = self.add_group_features('Group', features)
                 if grouped_feature is not None:
-                    features.append(grouped_feature)
+                    stack[-1][0].append(grouped_feature)
+            elif isinstance(shape, TreeList):
+                stack.append(([], iter(shape[1:])))
             else:
                 properties = dict(shape.properties)
                 self.source.check_markup_errors(properties)
@@ -127,11 +139,10 @@ class PowerpointLayer(MapLayer):
                 elif 'path' in properties:
                     pass
                 elif not properties.get('exclude', False):
-                    feature = self.flatmap.new_feature(self.id, shape.geometry, properties)
+                    feature = self.flatmap.new_feature(self.id, shape.geometry, properties, owned=True)
                     features.append(feature)
                     shape.set_property('geojson_id', feature.geojson_id)
                     shape.set_property('feature', feature)
-        return features
 
 #===============================================================================
 
@@ -184,9 +195,7 @@ class PowerpointSource(MapSource):
     #=========================
         svg_maker = SvgMaker(self.__powerpoint)
         svg_maker.add_slides(self.__slides)
-        svg_data = BytesIO(svg_maker.svg_bytes())
-        svg_data.seek(0)
-        return svg_data.read()
+        return svg_maker.svg_bytes()
 
     def __make_svg(self):
     #====================
@@ -403,8 +403,9 @@ class Slide:
 class Powerpoint():
     def __init__(self, flatmap: 'FlatMap', source: 'PowerpointSource',      # type: ignore
                        SlideClass=Slide, slide_options: Optional[dict]=None):
-        ppt_bytes = FilePath(source.href).get_BytesIO()
-        pptx = Presentation(ppt_bytes)
+        with FilePath(source.href).get_local_fp() as pptx_file:
+            pptx = Presentation(pptx_file)
+            colour_theme = ColourTheme(pptx_file)
 
         (width, height) = (pptx.slide_width, pptx.slide_height)
         self.__transform = Transform([[WORLD_METRES_PER_EMU,                     0, 0],
@@ -417,7 +418,6 @@ class Powerpoint():
         # southwest and northeast corners
         self.__bounds = (top_left[0], bottom_right[1], bottom_right[0], top_left[1])
 
-        colour_theme = ColourTheme(ppt_bytes)
         if slide_options is None:
             slide_options = {}
         self.__slides: list[Slide] = [SlideClass(flatmap, source,
@@ -18,7 +18,6 @@
 #
 #===============================================================================
 
-from io import StringIO
 from math import sqrt
 from typing import Any, Optional
 import xml.etree.ElementTree as ET
@@ -74,6 +73,9 @@ MIN_STROKE_WIDTH = 0.5
 
 TEXT_MARGINS = (6, 0)   # pixels
 
+# As written by ``svgwrite``
+SVG_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8" ?>\n'
+
 #===============================================================================
 
 def text_alignment(shape: PptxShape):
@@ -584,14 +586,17 @@ class SvgMaker:
             self.__drawing.elements[0].xml.attrib['data-metadata-format'] = 'text/turtle'
             self.__drawing.elements[0].xml.attrib['data-metadata'] = self.__celldl.as_encoded_turtle()
             self.__drawing.set_metadata(ET.fromstring(self.__celldl.as_xml()))
-        self.__drawing.write(file_object, pretty=True, indent=4)
+        # Indent in place rather than have ``Drawing.write()`` re-parse its output
+        # with ``minidom``, and write the encoded SVG without first prefixing it
+        # with the XML declaration
+        xml = self.__drawing.get_xml()
+        ET.indent(xml, space=4*' ')
+        file_object.writelines([SVG_XML_DECLARATION, ET.tostring(xml, encoding='utf-8')])
 
     def svg_bytes(self):
     #===================
-        svg = StringIO()
-        self.__drawing.write(svg)
-        svg_bytes = svg.getvalue().encode('utf-8')
-        svg.close()
-        return svg_bytes
+        # Encode directly to UTF-8 as ``Drawing.write()`` decodes the encoded
+        # XML to a string, which we would then have to re-encode
+        return SVG_XML_DECLARATION + ET.tostring(self.__drawing.get_xml(), encoding='utf-8')
 
 #===============================================================================
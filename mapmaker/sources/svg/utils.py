@@ -81,11 +81,13 @@ __unit_scaling = {
     'ex': None,      # ex/pt depends on current font size
     }
 
+LENGTH_UNITS_RE = re.compile(r'(.*)(em|ex|px|in|cm|mm|pt|pc|%)')
+
 def length_as_pixels(length: str | float) -> float:
 #==================================================
     if not isinstance(length, str):
         return length
-    match = re.search(r'(.*)(em|ex|px|in|cm|mm|pt|pc|%)', length)
+    match = LENGTH_UNITS_RE.search(length)
     if match is None:
         return float(length)
     else:
@@ -98,7 +100,7 @@ def length_as_points(length: str | float) -> float:
 #==================================================
     if not isinstance(length, str):
         return length
-    match = re.search(r'(.*)(em|ex|px|in|cm|mm|pt|pc|%)', length)
+    match = LENGTH_UNITS_RE.search(length)
     if match is None:
         return float(length)
     else:
@@ -142,10 +144,13 @@ def __match_to_char(m):
     else:
         return chr(int(s[2:4], 16))
 
+ADOBE_ENCODED_RE = re.compile('(_x.._)|(_)')
+NUMERIC_SUFFIX_RE = re.compile('( [0-9]+)$')
+
 def adobe_decode(s):
 #===================
-    markup = re.sub('(_x.._)|(_)', __match_to_char, s).strip()
-    numeric_suffix = re.search('( [0-9]+)$', markup)
+    markup = ADOBE_ENCODED_RE.sub(__match_to_char, s).strip()
+    numeric_suffix = NUMERIC_SUFFIX_RE.search(markup)
     return markup if numeric_suffix is None else markup[0:-len(numeric_suffix[1])].strip()
 
 def adobe_decode_markup(element):
@@ -159,11 +164,13 @@ def __match_to_hex(m):
             '_' if c in string.whitespace else
             '_x{:02X}_'.format(ord(c)))
 
+ANY_CHAR_RE = re.compile('.')
+
 def adobe_encode(s, suffix=None):
 #================================
     if suffix is not None:
         s = f'{s} {str(suffix)} '
-    return re.sub('.', __match_to_hex, s)
+    return ANY_CHAR_RE.sub(__match_to_hex, s)
 
 #===============================================================================
 
@@ -22,7 +22,9 @@ import io
 import json
 import os
 import pathlib
-from typing import Any
+import shutil
+import tempfile
+from typing import Any, IO
 import urllib.error
 from urllib.parse import urljoin, urlparse
 import urllib.request
@@ -52,6 +54,17 @@ def pathlib_path(path: str) -> pathlib.Path:
 def set_as_list(s):
     return list(s) if isinstance(s, set) else s
 
+# JSON without whitespace, for output that is only read by software.
+# NB. ``json.dumps()`` encodes in a single C call whereas ``json.dump()``
+#     encodes and writes in chunks, so we always encode to a string
+def compact_json(data: Any) -> str:
+    return json.dumps(data, separators=(',', ':'), default=set_as_list)
+
+#===============================================================================
+
+# Size of blocks when copying a remote file to local storage
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 #===============================================================================
 
 class FilePathError(IOError):
@@ -108,6 +121,22 @@ class FilePath(object):
         bytesio.seek(0)
         return bytesio
 
+    def get_local_fp(self) -> IO[bytes]:
+        # A seekable file object that doesn't hold the file's contents in memory.
+        # Local files are opened directly, remote files are streamed into a
+        # temporary file which is deleted when closed
+        url = urlparse(self.__url)
+        if url.scheme == 'file':
+            try:
+                return open(urllib.request.url2pathname(url.path), 'rb')
+            except OSError:
+                raise FilePathError('Cannot open path: {}'.format(self.__url)) from None
+        local_fp = tempfile.TemporaryFile()
+        with self.get_fp() as fp:
+            shutil.copyfileobj(fp, local_fp, DOWNLOAD_CHUNK_SIZE)
+        local_fp.seek(0)
+        return local_fp
+
     def join_path(self, path: str) -> 'FilePath':
         return FilePath(urljoin(self.__url, path))
 
@@ -23,10 +23,17 @@ from typing import Any, Optional
 #===============================================================================
 
 class PropertyMixin:
-    def __init__(self, properties: Optional[dict[str, Any]]=None):
-        self.__properties = {}
-        if properties is not None:
-            self.__properties.update(properties)
+    __slots__ = ('__get', '__properties')
+
+    def __init__(self, properties: Optional[dict[str, Any]]=None, owned: bool=False):
+        if properties is None:
+            self.__properties = {}
+        elif owned:
+            # The caller has given us its properties so they don't need copying
+            self.__properties = properties
+        else:
+            self.__properties = dict(properties)
+        self.__get = self.__properties.get      # Properties are looked up very frequently
 
     @property
     def properties(self):
@@ -43,10 +50,10 @@ class PropertyMixin:
             self.__properties[key] = [self.__properties[key], value]
 
     def get_property(self, key: str, default: Any=None) -> Any:
-        return self.__properties.get(key, default)
+        return self.__get(key, default)
 
     def has_property(self, key: str) -> bool:
-        return self.__properties.get(key, '') != ''
+        return self.__get(key, '') != ''
 
     def pop_property(self, key: str, default: Any=None) -> Any:
         return self.__properties.pop(key, default)
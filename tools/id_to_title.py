@@ -1,6 +1,8 @@
 #===============================================================================
 
 from datetime import datetime, timezone
+from functools import lru_cache
+import multiprocessing
 
 #===============================================================================
 
@@ -20,10 +22,28 @@ __version__ = '1.1.0'
 SVG_NS = 'http://www.w3.org/2000/svg'
 SVG_GROUP = f'{{{SVG_NS}}}g'
 
-NAMESPACE_MAP = {
-    None: 'http://www.w3.org/2000/svg',
-    'xlink': 'http://www.w3.org/1999/xlink',
-}
+# Titles are created with a plain string tag, not a QName, and without a
+# namespace so that they serialise as ``<title>`` whether or not the SVG
+# has a default namespace
+TITLE_TAG = 'title'
+
+# Compiled once rather than for every file
+TOP_LEVEL_COMMENTS = etree.XPath('/comment()')
+
+# Only ids starting with one of these can decode to markup (a leading ``_`` may
+# be an encoded character and a leading space is stripped when decoding). This
+# also excludes Illustrator's ``SVGID_`` identifiers
+MARKUP_ID_STARTS = frozenset(('.', '_', 'i', ' '))
+
+# The same test, evaluated by libxml2, to find all the elements which may have markup
+MARKUP_ID_ELEMENTS = etree.XPath('.//*[{}]'.format(
+    ' or '.join(f'starts-with(@id, "{start}")' for start in sorted(MARKUP_ID_STARTS))))
+
+#===============================================================================
+
+def run_timestamp():
+#===================
+    return datetime.now(timezone.utc).isoformat()
 
 #===============================================================================
 
@@ -31,11 +51,17 @@ class SvgTree:
     def __init__(self, svg_tree):
         self.__tree = svg_tree
         self.__root = self.__tree.getroot()
-        self.__comments = self.__tree.xpath('/comment()')
 
     @classmethod
-    def from_file(cls, svg_file):
-        return cls(etree.parse(svg_file))
+    def from_file(cls, svg_file, transform=None):
+        if transform is None:
+            return cls(etree.parse(svg_file))
+        # Transform each element, except the root, as soon as it has been parsed
+        parser = etree.iterparse(svg_file, events=('end',))
+        for (_, element) in parser:
+            if element.getparent() is not None:
+                transform(element)
+        return cls(parser.root.getroottree())
 
     @property
     def root(self):
@@ -43,7 +69,8 @@ class SvgTree:
 
     @property
     def comments(self):
-        return self.__comments
+        # Only searched for when needed, as processing a file doesn't use them
+        return TOP_LEVEL_COMMENTS(self.__tree)
 
     def findall(self, pattern):
         return self.__tree.findall(pattern)
@@ -63,62 +90,114 @@ class SvgTree:
 #===============================================================================
 
 class DeGrouper:
-    def __init__(self, svg_tree):
-        self.__svg_tree = svg_tree
-
-    def degroup(self):
-    #=================
-        degrouped = SvgTree(etree.ElementTree(self.__process_element(self.__svg_tree.root)))
-        degrouped.add_comments(self.__svg_tree.comments)
-        degrouped.add_text_comment(f' Degrouped at {datetime.now(timezone.utc).isoformat()} by {__file__} version {__version__} ')
+    def __init__(self, svg_file, timestamp=None):
+        self.__svg_file = svg_file
+        self.__timestamp = timestamp if timestamp is not None else run_timestamp()
+
+    def degroup(self, transform=None):
+    #=================================
+        # Extraneous groups are found while the SVG is being parsed and then removed
+        # from the parsed tree, rather than by building a second, degrouped, tree.
+        # Any ``transform`` is applied in the same pass, to each element except the
+        # root, as soon as the element has been parsed
+        extraneous_groups = []
+        comments = []
+        parser = etree.iterparse(self.__svg_file, events=('end', 'comment'))
+        for (event, element) in parser:
+            if event == 'comment':
+                if element.getparent() is not None:
+                    comments.append(element)
+            elif element.tag == SVG_GROUP and len(element.attrib) == 0 and len(element) <= 1:
+                extraneous_groups.append(element)
+            elif transform is not None and element.getparent() is not None:
+                transform(element)
+        # Only comments outside of the root element are kept
+        for comment in comments:
+            comment.getparent().remove(comment)
+        # Groups end in post-order so any nested extraneous group has already been removed
+        for group in extraneous_groups:
+            if len(group):
+                group.addprevious(group[0])
+            group.getparent().remove(group)
+        degrouped = SvgTree(parser.root.getroottree())
+        degrouped.add_text_comment(f' Degrouped at {self.__timestamp} by {__file__} version {__version__} ')
         return degrouped
 
-    def __process_element(self, element, output=None):
-    #=================================================
-        if not isinstance(element, etree._Comment):
-            if output is None:
-                output = etree.Element(element.tag, **element.attrib, nsmap=NAMESPACE_MAP)
-            elif element.tag != SVG_GROUP or len(element.attrib) > 0 or len(element) > 1:
-                output = etree.SubElement(output, element.tag, attrib=element.attrib)
-                if element.text is not None:
-                    output.text = element.text
-                if element.tail is not None:
-                    output.tail = element.tail
-            for child in element:
-                self.__process_element(child, output)
-        return output
-
 #===============================================================================
 
+# Exported SVG often repeats ids, so remember their markup. Repeated ids then
+# also share a single markup string rather than each having their own copy
+@lru_cache(maxsize=65536)
+def id_markup(id):
+#=================
+    markup = adobe_decode(id)
+    # Dispatch on the first character so that most ids need
+    # only a single comparison
+    first = markup[:1]
+    if first == '.':
+        return markup
+    elif first == 'i' and markup.startswith('id '):
+        # Decoded markup has been stripped, so there is always something after
+        # the ``id ``, and we can split what follows without slicing a token list
+        return f'.id({"_".join(markup[3:].split())})'
+    elif id[:1] == '_':
+        return f'.id({markup.replace(" ", "_")})'
+    return None
+
+def title_element(xml_element):
+#==============================
+    # A single attribute lookup rejects most elements
+    id = xml_element.get('id')
+    if (id is None or id[:1] not in MARKUP_ID_STARTS
+     or (markup := id_markup(id)) is None):
+        return
+    # We know the element has an ``id`` so remove it without a default
+    del xml_element.attrib['id']
+    # Create the title as the element's first child, instead of
+    # appending it and then moving it
+    title = xml_element.makeelement(TITLE_TAG)
+    title.text = markup
+    xml_element.insert(0, title)
+
 class Entitler:
-    def __init__(self, svg_tree):
+    def __init__(self, svg_tree, timestamp=None):
         self.__svg_tree = svg_tree
+        self.__timestamp = timestamp if timestamp is not None else run_timestamp()
+
+    @classmethod
+    def title_file(cls, svg_file, timestamp=None, degroup=False):
+    #============================================================
+        # Elements are titled as soon as they have been parsed, rather than by
+        # walking the tree after it has been parsed, and in the same pass as
+        # degrouping
+        if degroup:
+            svg_tree = DeGrouper(svg_file, timestamp).degroup(transform=title_element)
+        else:
+            svg_tree = SvgTree.from_file(svg_file, transform=title_element)
+        entitler = cls(svg_tree, timestamp)
+        return entitler.__add_title_comment()
 
     def title(self):
     #===============
-        for xml_element in self.__svg_tree.findall('.//*[@id]'):
-            id = xml_element.attrib['id']
-            if not id.startswith('SVGID'):
-                markup = adobe_decode(id)
-                if markup.startswith('.') or markup.startswith('id '):
-                    if markup.startswith('id '):
-                        tokens = markup.split()
-                        if len(tokens) >= 2:
-                            markup = f'.id({"_".join(tokens[1:])})'
-                elif id.startswith('_'):
-                    markup = f'.id({markup.replace(" ", "_")})'
-                else:
-                    markup = None
-                if markup is not None:
-                    xml_element.attrib.pop('id', None)
-                    title = etree.SubElement(xml_element, 'title')
-                    title.text = markup
-                    xml_element.insert(0, title)
-        self.__svg_tree.add_text_comment(f' Titled at {datetime.now(timezone.utc).isoformat()} by {__file__} version {__version__} ')
+        # Only elements with an ``id`` that may be markup are returned to Python
+        for xml_element in MARKUP_ID_ELEMENTS(self.__svg_tree.root):
+            title_element(xml_element)
+        return self.__add_title_comment()
+
+    def __add_title_comment(self):
+    #=============================
+        self.__svg_tree.add_text_comment(f' Titled at {self.__timestamp} by {__file__} version {__version__} ')
         return self.__svg_tree
 
 #===============================================================================
 
+def process_file(svg_file, output_file, degroup=True, timestamp=None):
+#=====================================================================
+    svg_tree = Entitler.title_file(svg_file, timestamp, degroup=degroup)
+    svg_tree.save(output_file)
+
+#===============================================================================
+
 if __name__ == '__main__':
     import argparse
     import sys
@@ -139,16 +218,15 @@ if __name__ == '__main__':
     elif args.output is not None and len(args.svg_files) > 1:
         sys.exit('Can only specify --output if processing a single file')
 
-    for svg_file in args.svg_files:
-        svg_tree = SvgTree.from_file(svg_file)
-
-        if not args.no_degroup:
-            degrouper = DeGrouper(svg_tree)
-            svg_tree = degrouper.degroup()
-
-        entitler = Entitler(svg_tree)
-        svg_tree = entitler.title()
-
-        svg_tree.save(svg_file if args.output is None else args.output)
+    # All files processed in this run are stamped with the same time
+    timestamp = run_timestamp()
+    file_args = [(svg_file, svg_file if args.output is None else args.output, not args.no_degroup, timestamp)
+                    for svg_file in args.svg_files]
+    if len(file_args) == 1:
+        process_file(*file_args[0])
+    else:
+        # Files are independent so process them in parallel
+        with multiprocessing.Pool() as pool:
+            pool.starmap(process_file, file_args)
 
 #===============================================================================